@@ -1,10 +1,11 @@
 from flask import Flask, render_template, request, jsonify
 import asyncio
+import concurrent.futures
+import itertools
 import os
 import sys
 import json
 import threading
-import queue
 import logging
 import re
 from logging.config import dictConfig
@@ -33,9 +34,21 @@ from client import SolarWindsClient
 app = Flask(__name__)
 app.logger.setLevel(logging.INFO)
 
-# Initialize Queue for async communication
-message_queue = queue.Queue()
-response_queue = queue.Queue()
+# Event loop owned by the background worker; chat requests are submitted to
+# it as coroutines so the Flask threads never block the loop
+worker_loop = None
+worker_stop = None
+
+# The client keeps one conversation (memory and chat context), so turns are
+# taken one at a time; a turn's own tool calls still run concurrently
+chat_lock = None
+
+# Responses from the client normally already carry a "**Response N:**" header
+RESPONSE_PREFIX = '**Response '
+RESPONSE_PREFIX_RE = re.compile(r'\*\*Response \d+:\*\*')
+
+# Numbers the responses; next() on a count is atomic under the GIL
+response_counter = itertools.count(1)
 
 # Global client object
 client = None
@@ -57,22 +70,22 @@ def handle_chat():  # Changed function name to avoid conflict
     if not user_message:
         return jsonify({'error': 'No message provided'}), 400
     
-    # Put the message in the queue for the background worker
-    message_queue.put(user_message)
+    if worker_loop is None:
+        return jsonify({'error': 'Server not connected'}), 503
+    
+    # Hand the message to the worker's event loop and wait for this chat only
+    future = asyncio.run_coroutine_threadsafe(process_chat(user_message), worker_loop)
     
-    # Wait for the response with a timeout
     try:
-        response = response_queue.get(timeout=60)
-        
-        # Post-process response to ensure formatting
-        ai_message_count = sum(1 for m in list(message_queue.queue) if isinstance(m, str) and not m.startswith('__'))
+        response = future.result(timeout=60)
         
         # Ensure response follows the pattern
-        if not re.match(r'^\*\*Response \d+:\*\*', response):
-            response = f"**Response {ai_message_count + 1}:**\n{response}"
+        if not (response.startswith(RESPONSE_PREFIX) and RESPONSE_PREFIX_RE.match(response)):
+            response = f"**Response {next(response_counter)}:**\n{response}"
         
         return jsonify({'response': response})
-    except queue.Empty:
+    except concurrent.futures.TimeoutError:
+        future.cancel()
         return jsonify({'error': 'Response timeout'}), 504
 
 @app.route('/api/status', methods=['GET'])
@@ -83,45 +96,51 @@ def status():
         return jsonify({'status': 'connected'})
     return jsonify({'status': 'disconnected'})
 
-def background_worker():
-    """Background worker to process messages asynchronously"""
-    global client, server_path
-    
-    # Run the event loop in this thread
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+async def process_chat(message):
+    """Process one chat message once the previous turn has finished"""
+    async with chat_lock:
+        try:
+            return await client.process_query_with_langchain(message)
+        except Exception as e:
+            app.logger.error(f"Error processing message: {e}")
+            return f"Error: {str(e)}"
+
+async def worker_main():
+    """Connect the client, then serve submitted chats until asked to stop"""
+    global client, worker_loop, chat_lock, worker_stop
     
     # Initialize the client
     client = SolarWindsClient()
     
     # Connect to the server
     try:
-        loop.run_until_complete(client.connect_to_server(server_path))
+        await client.connect_to_server(server_path)
         app.logger.info("Connected to server successfully")
     except Exception as e:
         app.logger.error(f"Failed to connect to server: {e}")
         return
     
-    # Process messages from the queue
-    while True:
-        try:
-            message = message_queue.get()
-            if message == "__TERMINATE__":
-                break
-                
-            # Process the message
-            response = loop.run_until_complete(client.process_query_with_langchain(message))
-            
-            # Put the response in the response queue
-            response_queue.put(response)
-            
-        except Exception as e:
-            app.logger.error(f"Error processing message: {e}")
-            response_queue.put(f"Error: {str(e)}")
-    
-    # Clean up
-    loop.run_until_complete(client.cleanup())
-    loop.close()
+    # Chats submitted by handle_chat run as tasks on this loop until stopped
+    chat_lock = asyncio.Lock()
+    worker_stop = asyncio.Event()
+    worker_loop = asyncio.get_running_loop()
+    try:
+        await worker_stop.wait()
+    finally:
+        worker_loop = None
+        
+        # Clean up
+        await client.cleanup()
+
+def background_worker():
+    """Background worker to process messages asynchronously"""
+    asyncio.run(worker_main())
+
+def stop_background_worker():
+    """Wake the worker so it stops taking chats and cleans up"""
+    loop = worker_loop
+    if loop is not None:
+        loop.call_soon_threadsafe(worker_stop.set)
 
 def start_background_worker(server_script_path):
     """Start the background worker thread"""
@@ -147,6 +166,6 @@ if __name__ == '__main__':
     # Start the Flask app
     app.run(debug=True, use_reloader=False)
     
-    # Send termination signal to the worker thread
-    message_queue.put("__TERMINATE__")
+    # Stop the worker so it can clean up
+    stop_background_worker()
     worker_thread.join(timeout=5)
\ No newline at end of file
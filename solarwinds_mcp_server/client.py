@@ -634,12 +634,33 @@ from typing import Tuple, Optional, Dict, Any, List, Union
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from pydantic import BaseModel, Field, validator
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from anthropic.types import ContentBlock, ToolUseBlock, TextBlock
 from dotenv import load_dotenv
 
+# Optional: C++ fuzzy matching; falls back to difflib when not installed
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz_process = None
+
+def closest_match(word: str, choices: List[str], cutoff: float = 0.75) -> Optional[str]:
+    """Return the choice most similar to word with a score of at least cutoff, or None"""
+    if fuzz_process is not None:
+        match = fuzz_process.extractOne(word, choices, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        return match[0] if match else None
+    matches = get_close_matches(word, choices, n=1, cutoff=cutoff)
+    return matches[0] if matches else None
+
+# Timeout scope that doesn't wrap the awaited coroutine in an extra Task;
+# asyncio.timeout is 3.11+, async_timeout provides it on older versions
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:
+    from async_timeout import timeout as async_timeout
+
 # Import LangChain components
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationBufferWindowMemory
 from langchain_core.prompts import PromptTemplate
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
 from langchain_anthropic import ChatAnthropic
@@ -670,7 +691,7 @@ class SolarWindsClient:
             sys.exit(1)
             
         # Initialize Anthropic API client
-        self.anthropic = Anthropic(api_key=api_key)
+        self.anthropic = AsyncAnthropic(api_key=api_key)
         
         # Initialize LangChain components
         self.llm = ChatAnthropic(
@@ -679,13 +700,13 @@ class SolarWindsClient:
             temperature=0.3
         )
         
-        # Improve conversation memory to maintain longer context
-        self.memory = ConversationBufferMemory(
+        # Keep a bounded window of recent exchanges so each turn's prompt stays small
+        self.memory = ConversationBufferWindowMemory(
+            k=10,
             return_messages=True,
             memory_key="chat_history",
             input_key="input",
-            output_key="output",
-            max_token_limit=100000  # Increase token limit for more context
+            output_key="output"
         )
         
         # Chat session context for maintaining state across interactions
@@ -741,11 +762,77 @@ class SolarWindsClient:
             }
         }
         
+        # State terms recognised when cleaning queries, applied before intent_mappings
+        self.query_state_mappings = {
+            "assigned": "In Progress",
+            "in-progress": "In Progress", 
+            "inprogress": "In Progress",
+            "in_progress": "In Progress",
+            "in progress": "In Progress",  # Added explicit space mapping
+            "open": "Open",
+            "new": "New",
+            "pending": "Pending",
+            "resolved": "Resolved",
+            "closed": "Closed",
+            "done": "Closed",
+            "completed": "Closed",
+            "finished": "Closed"
+        }
+        
+        # Lowercased views of common_terms for the typo matcher
+        self._index_common_terms()
+        
+        # Query-cleaning regexes, compiled once instead of on every query
+        self._intent_patterns = self._compile_intent_patterns()
+        self._word_re = re.compile(r'\b\w+\b')
+        self._email_re = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        
         # To store tools for LangChain
         self.tools = []
         self.tool_map = {}
         
         logger.info("Initialized SolarWindsClient with LangChain and Anthropic API")
+    
+    def _index_common_terms(self):
+        """Precompute lowercased term lists and lowercase-to-original lookups for common_terms"""
+        self._lower_terms = {}
+        self._lower_to_orig = {}
+        for category, terms in self.common_terms.items():
+            self._lower_terms[category] = [t.lower() for t in terms]
+            lower_to_orig = {}
+            for term in terms:
+                # First spelling wins, as list.index() did
+                lower_to_orig.setdefault(term.lower(), term)
+            self._lower_to_orig[category] = lower_to_orig
+    
+    def _compile_intent_patterns(self):
+        """Compile each intent mapping into one alternation regex, as (pattern, terms, replacement, kind) in application order"""
+        def alternation(terms):
+            # Longest first so a term never loses to a shorter prefix of itself
+            return "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+        
+        # Look for patterns like "state=assigned", "state is assigned", "state assigned"
+        state_prefix = r"(?:state\s*=\s*|state\s+is\s+|state\s+|status\s*=\s*|status\s+is\s+|status\s+)"
+        # Look for patterns like "priority=high", "priority is high", "high priority"
+        priority_prefix = r"(?:priority\s*=\s*|priority\s+is\s+|priority\s+)"
+        
+        states = self.query_state_mappings
+        intent_states = self.intent_mappings["states"]
+        priorities = self.intent_mappings["priorities"]
+        entities = self.intent_mappings["entities"]
+        rewrites = [
+            (state_prefix + f"(?P<term>{alternation(states)})", states, 'state="{}"', " (state)"),
+            (state_prefix + f"(?P<term>{alternation(intent_states)})", intent_states, 'state="{}"', " (state)"),
+            (priority_prefix + f"(?P<term>{alternation(priorities)})", priorities, 'priority="{}"', " (priority)"),
+            (f"(?P<term>{alternation(priorities)})" + r"\s+priority", priorities, 'priority="{}"', " (priority)"),
+            (rf"\b(?P<term>{alternation(entities)})\b", entities, "{}", ""),
+        ]
+        
+        return [
+            (re.compile(pattern, re.IGNORECASE), {term.lower(): (term, formal) for term, formal in terms.items()},
+             replacement, kind)
+            for pattern, terms, replacement, kind in rewrites
+        ]
         
     async def connect_to_server(self, server_script_path: str):
         """Connect to the SolarWinds Service Desk MCP server"""
@@ -778,7 +865,8 @@ class SolarWindsClient:
             self.session = await self.exit_stack.enter_async_context(ClientSession(self.stdio, self.write))
             
             try:
-                await asyncio.wait_for(self.session.initialize(), timeout=60.0)
+                async with async_timeout(60.0):
+                    await self.session.initialize()
             except asyncio.TimeoutError:
                 print("⚠️ Initialization timed out but we'll continue anyway")
                 
@@ -814,6 +902,7 @@ class SolarWindsClient:
                 for param in tool.inputSchema["properties"]:
                     param_names.add(param)
         self.common_terms["parameter_names"] = list(param_names)
+        self._index_common_terms()
         
         # Create LangChain tools from MCP tools
         for mcp_tool in mcp_tools:
@@ -891,10 +980,10 @@ class SolarWindsClient:
         # Check known domains for typos
         domain = email.split('@')[1]
         common_domains = ["gmail.com", "yahoo.com", "my.unt.edu", "organization.com"]
-        for correct_domain in common_domains:
-            if domain.lower() != correct_domain and get_close_matches(domain.lower(), [correct_domain], n=1, cutoff=0.75):
-                corrected_email = email.replace(domain, correct_domain)
-                return True, corrected_email
+        correct_domain = closest_match(domain.lower(), common_domains)
+        if correct_domain is not None and correct_domain != domain.lower():
+            corrected_email = email.replace(domain, correct_domain)
+            return True, corrected_email
                 
         # If no corrections needed, return the original email
         return True, email
@@ -962,49 +1051,29 @@ class SolarWindsClient:
         
         # Store corrections for display
         corrections = []
-        state_mappings = {
-                            "assigned": "In Progress",
-                            "in-progress": "In Progress", 
-                            "inprogress": "In Progress",
-                            "in_progress": "In Progress",
-                            "in progress": "In Progress",  # Added explicit space mapping
-                            "open": "Open",
-                            "new": "New",
-                            "pending": "Pending",
-                            "resolved": "Resolved",
-                            "closed": "Closed",
-                            "done": "Closed",
-                            "completed": "Closed",
-                            "finished": "Closed"
-                        }
         
-        for state_term, formal_state in state_mappings.items():
-        # Look for patterns like "state=assigned", "state is assigned", "state assigned"
-            patterns = [
-                f"state\\s*=\\s*{state_term}",
-                f"state\\s+is\\s+{state_term}",
-                f"state\\s+{state_term}",
-                f"status\\s*=\\s*{state_term}",
-                f"status\\s+is\\s+{state_term}",
-                f"status\\s+{state_term}",
-                f"tickets\\s+with\\s+state\\s+{state_term}",  # Added pattern for "tickets with state X"
-                f"incidents\\s+with\\s+state\\s+{state_term}"  # Added pattern for "incidents with state X"
-            ]
-            for pattern in patterns:
-                if re.search(pattern, cleaned_query, re.IGNORECASE):
-                    old_query = cleaned_query
-                    cleaned_query = re.sub(pattern, f"state=\"{formal_state}\"", cleaned_query, flags=re.IGNORECASE)
-                    if old_query != cleaned_query:
-                        corrections.append(f"'{state_term}' → '{formal_state}' (state)")
+        # Handle intent mapping for states, priorities and entities, in that order;
+        # each mapping is one pass of its alternation regex
+        for pattern, terms, replacement, kind in self._intent_patterns:
+            def rewrite(match):
+                term, formal = terms[match.group("term").lower()]
+                rewritten = replacement.format(formal)
+                if rewritten != match.group(0):
+                    correction = f"'{term}' → '{formal}'{kind}"
+                    if correction not in corrections:
+                        corrections.append(correction)
+                return rewritten
+            
+            cleaned_query = pattern.sub(rewrite, cleaned_query)
+        
         # Function to find and replace misspelled terms
-        def replace_misspelled(text, term_list, threshold=0.75):
-            words = re.findall(r'\b\w+\b', text)
+        def replace_misspelled(text, terms_lower, lower_to_orig, threshold=0.75):
+            words = self._word_re.findall(text)
             for word in words:
-                if word.lower() not in [t.lower() for t in term_list]:
-                    matches = get_close_matches(word.lower(), [t.lower() for t in term_list], n=1, cutoff=threshold)
-                    if matches:
-                        best_match_index = [t.lower() for t in term_list].index(matches[0])
-                        correct_term = term_list[best_match_index]
+                if word.lower() not in lower_to_orig:
+                    match = closest_match(word.lower(), terms_lower, threshold)
+                    if match is not None:
+                        correct_term = lower_to_orig[match]
                         if word != correct_term:
                             old_text = text
                             # Replace with correct casing
@@ -1014,68 +1083,22 @@ class SolarWindsClient:
                                 corrections.append(f"'{word}' → '{correct_term}'")
             return text
         
-        # Handle intent mapping for states
-        for state_term, formal_state in self.intent_mappings["states"].items():
-            # Look for patterns like "state=assigned", "state is assigned", "state assigned"
-            patterns = [
-                f"state\\s*=\\s*{state_term}",
-                f"state\\s+is\\s+{state_term}",
-                f"state\\s+{state_term}",
-                f"status\\s*=\\s*{state_term}",
-                f"status\\s+is\\s+{state_term}",
-                f"status\\s+{state_term}"
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, cleaned_query, re.IGNORECASE):
-                    old_query = cleaned_query
-                    cleaned_query = re.sub(pattern, f"state=\"{formal_state}\"", cleaned_query, flags=re.IGNORECASE)
-                    if old_query != cleaned_query:
-                        corrections.append(f"'{state_term}' → '{formal_state}' (state)")
-        
-        # Handle intent mapping for priorities
-        for priority_term, formal_priority in self.intent_mappings["priorities"].items():
-            # Look for patterns like "priority=high", "priority is high", "high priority"
-            patterns = [
-                f"priority\\s*=\\s*{priority_term}",
-                f"priority\\s+is\\s+{priority_term}",
-                f"priority\\s+{priority_term}",
-                f"{priority_term}\\s+priority"
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, cleaned_query, re.IGNORECASE):
-                    old_query = cleaned_query
-                    cleaned_query = re.sub(pattern, f"priority=\"{formal_priority}\"", cleaned_query, flags=re.IGNORECASE)
-                    if old_query != cleaned_query:
-                        corrections.append(f"'{priority_term}' → '{formal_priority}' (priority)")
-        
-        # Handle entity mappings
-        for entity_term, formal_entity in self.intent_mappings["entities"].items():
-            if re.search(r'\b' + re.escape(entity_term) + r'\b', cleaned_query, re.IGNORECASE):
-                old_query = cleaned_query
-                cleaned_query = re.sub(r'\b' + re.escape(entity_term) + r'\b', formal_entity, cleaned_query, flags=re.IGNORECASE)
-                if old_query != cleaned_query:
-                    corrections.append(f"'{entity_term}' → '{formal_entity}'")
-        
         # Correct common misspellings in query
-        for category, terms in self.common_terms.items():
-            cleaned_query = replace_misspelled(cleaned_query, terms)
+        for category, terms_lower in self._lower_terms.items():
+            cleaned_query = replace_misspelled(cleaned_query, terms_lower, self._lower_to_orig[category])
         
         # Correct email addresses with common typos
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, cleaned_query)
+        emails = self._email_re.findall(cleaned_query)
         for email in emails:
             if '@' in email:
                 # Check common email domain typos
                 domain = email.split('@')[1]
                 common_domains = ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com"]
-                for correct_domain in common_domains:
-                    if domain.lower() != correct_domain and get_close_matches(domain.lower(), [correct_domain], n=1, cutoff=0.75):
-                        corrected_email = email.replace(domain, correct_domain)
-                        cleaned_query = cleaned_query.replace(email, corrected_email)
-                        corrections.append(f"'{email}' → '{corrected_email}'")
-                        break
+                correct_domain = closest_match(domain.lower(), common_domains)
+                if correct_domain is not None and correct_domain != domain.lower():
+                    corrected_email = email.replace(domain, correct_domain)
+                    cleaned_query = cleaned_query.replace(email, corrected_email)
+                    corrections.append(f"'{email}' → '{corrected_email}'")
         
         # Special handling for specific queries
         if "assigned" in cleaned_query.lower() and "state" not in cleaned_query.lower():
@@ -1219,7 +1242,7 @@ class SolarWindsClient:
             while retry_count <= max_retries:
                 try:
                     # Create the Claude API call
-                    response = self.anthropic.messages.create(
+                    response = await self.anthropic.messages.create(
                         model="claude-3-5-haiku-20241022",
                         max_tokens=1500,
                         system=system_prompt,
@@ -1231,6 +1254,7 @@ class SolarWindsClient:
                     # Parse and process the response
                     final_text = []
                     assistant_response = []
+                    tool_calls = []
                     
                     for content in response.content:
                         if content.type == 'text':
@@ -1239,7 +1263,6 @@ class SolarWindsClient:
                         elif content.type == 'tool_use':
                             tool_name = content.name
                             tool_args = content.input
-                            tool_id = content.id
                             
                             # Validate and correct email addresses in tool args if present
                             if tool_name == "create_incident" and tool_args.get("requester_email"):
@@ -1266,83 +1289,73 @@ class SolarWindsClient:
                                         logger.info(f"Corrected email from {tool_args['assignee_email']} to {corrected_email}")
                                         tool_args["assignee_email"] = corrected_email
                             
+                            tool_calls.append(content)
+                    
+                    if tool_calls:
+                        # Run every requested tool concurrently; the MCP calls are I/O-bound
+                        results = await asyncio.gather(
+                            *(self._execute_tool(call.name, call.input) for call in tool_calls),
+                            return_exceptions=True
+                        )
+                        
+                        # Return all tool results to Claude in one message, in request order
+                        tool_results = []
+                        for call, result in zip(tool_calls, results):
+                            if isinstance(result, BaseException):
+                                logger.error(f"Error executing tool {call.name}: {result}", exc_info=result)
+                                result = f"❌ Error executing tool {call.name}: {str(result)}"
+                                final_text.append(result)
+                            tool_results.append({
+                                "type": "tool_result", 
+                                "tool_use_id": call.id, 
+                                "content": [{"type": "text", "text": result}]
+                            })
+                        
+                        claude_messages.append({"role": "assistant", "content": tool_calls})
+                        claude_messages.append({"role": "user", "content": tool_results})
+                        
+                        # Get the next response from Claude with retry handling
+                        print("🔄 Processing results...")
+                        follow_up_retries = 0
+                        max_follow_up_retries = 2
+                        
+                        while follow_up_retries <= max_follow_up_retries:
                             try:
-                                # Use the _execute_tool method to run the tool with enhanced result handling
-                                result = await self._execute_tool(tool_name, tool_args)
-                                
-                                # If we had successful tool execution, update the Claude messages sequence
-                                claude_messages.append({"role": "assistant", "content": [content]})
-                                claude_messages.append({
-                                    "role": "user", 
-                                    "content": [
-                                        {
-                                            "type": "tool_result", 
-                                            "tool_use_id": tool_id, 
-                                            "content": [{"type": "text", "text": result}]
-                                        }
-                                    ]
-                                })
+                                follow_up_response = await self.anthropic.messages.create(
+                                    model="claude-3-5-haiku-20241022",
+                                    max_tokens=1500,
+                                    system=system_prompt,
+                                    messages=claude_messages,
+                                    tools=claude_tools,
+                                    temperature=0.3
+                                )
                                 
-                                # Get the next response from Claude with retry handling
-                                print("🔄 Processing results...")
-                                follow_up_retries = 0
-                                max_follow_up_retries = 2
+                                # Add the follow-up response to final text
+                                for content_item in follow_up_response.content:
+                                    if content_item.type == 'text':
+                                        final_text.append(content_item.text)
+                                        assistant_response.append(content_item)
                                 
-                                while follow_up_retries <= max_follow_up_retries:
-                                    try:
-                                        follow_up_response = self.anthropic.messages.create(
-                                            model="claude-3-5-haiku-20241022",
-                                            max_tokens=1500,
-                                            system=system_prompt,
-                                            messages=claude_messages,
-                                            tools=claude_tools,
-                                            temperature=0.3
-                                        )
-                                        
-                                        # Add the follow-up response to final text
-                                        for content_item in follow_up_response.content:
-                                            if content_item.type == 'text':
-                                                final_text.append(content_item.text)
-                                                assistant_response.append(content_item)
-                                        
-                                        # If we get here, break the retry loop
-                                        break
-                                        
-                                    except Exception as e:
-                                        follow_up_retries += 1
-                                        if "rate limit" in str(e).lower() or "429" in str(e):
-                                            # Apply exponential backoff
-                                            wait_time = retry_backoff ** follow_up_retries
-                                            logger.warning(f"Rate limited on follow-up. Retrying in {wait_time}s...")
-                                            await asyncio.sleep(wait_time)
-                                            
-                                            if follow_up_retries > max_follow_up_retries:
-                                                error_message = "Rate limit reached. Please try again later."
-                                                final_text.append(error_message)
-                                        else:
-                                            # For other errors, log and continue
-                                            logger.error(f"Error in follow-up response: {e}", exc_info=True)
-                                            error_message = f"❌ Error processing results: {str(e)}"
-                                            final_text.append(error_message)
-                                            break
+                                # If we get here, break the retry loop
+                                break
                                 
                             except Exception as e:
-                                logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
-                                error_message = f"❌ Error executing tool {tool_name}: {str(e)}"
-                                final_text.append(error_message)
-                                
-                                # Add the error message to the Claude messages sequence
-                                claude_messages.append({"role": "assistant", "content": [content]})
-                                claude_messages.append({
-                                    "role": "user", 
-                                    "content": [
-                                        {
-                                            "type": "tool_result", 
-                                            "tool_use_id": tool_id, 
-                                            "content": [{"type": "text", "text": error_message}]
-                                        }
-                                    ]
-                                })
+                                follow_up_retries += 1
+                                if "rate limit" in str(e).lower() or "429" in str(e):
+                                    # Apply exponential backoff
+                                    wait_time = retry_backoff ** follow_up_retries
+                                    logger.warning(f"Rate limited on follow-up. Retrying in {wait_time}s...")
+                                    await asyncio.sleep(wait_time)
+                                    
+                                    if follow_up_retries > max_follow_up_retries:
+                                        error_message = "Rate limit reached. Please try again later."
+                                        final_text.append(error_message)
+                                else:
+                                    # For other errors, log and continue
+                                    logger.error(f"Error in follow-up response: {e}", exc_info=True)
+                                    error_message = f"❌ Error processing results: {str(e)}"
+                                    final_text.append(error_message)
+                                    break
                     
                     # Break the retry loop if we get here
                     break
@@ -1570,10 +1583,8 @@ class SolarWindsClient:
                 
                 # Add a timeout for processing to avoid hanging
                 try:
-                    response = await asyncio.wait_for(
-                        self.process_query_with_langchain(query),
-                        timeout=60.0  # 60-second timeout
-                    )
+                    async with async_timeout(60.0):  # 60-second timeout
+                        response = await self.process_query_with_langchain(query)
                     print(f"\n{response}")
                     
                 except asyncio.TimeoutError: